@@ -4,6 +4,37 @@ Two Pointer Technique Examples
 This module demonstrates various categories of the two-pointer technique with examples.
 """
 
+from array import array, typecodes
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python paths below always work
+    np = None
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; without it the kernels below are plain Python functions
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Typecode for an `array.array` of Unicode characters; 'u' is deprecated in favour of 'w' from Python 3.13.
+_UNICODE_TYPECODE = 'w' if 'w' in typecodes else 'u'
+
+# Below this many elements the call overhead of the compiled fast paths outweighs their speedup.
+FAST_PATH_MIN_SIZE = 64
+
+# Sequences shorter than this use a length-specialized, fully unrolled `two_sum_sorted`. The generated code doubles
+# with every extra element, so the cutoff stays small.
+UNROLL_MAX_SIZE = 8
+
+
 def two_sum_sorted(arr, target):
     """
     Find a pair with a given sum in a sorted array.
@@ -25,8 +56,49 @@ def two_sum_sorted(arr, target):
     Space Complexity: O(1)
 
     This approach is more efficient than the brute force approach, which has a time complexity of O(n^2).
+
+    Implementation Note:
+    Before sweeping, both pointers are moved past elements that cannot be part of any pair. No element greater than
+    `target - arr[0]` has a partner, so `right` starts at the last element not above it; then no element less than
+    `target - arr[right]` has a partner either, so `left` starts at the first element not below that. Both
+    positions are found with the C `bisect` module in O(log n), which often removes most of the interpreted
+    iterations. With floats, `target - arr[0]` is rounded, so each bound is then nudged with the sweep's own sum
+    test; since rounded addition is monotonic, this leaves the pointers exactly where the sweep would have moved
+    them and never changes which pair is returned.
+    Arrays shorter than `UNROLL_MAX_SIZE` skip the loop entirely and run a version generated for their exact length
+    (see `_make_unrolled_two_sum_sorted`).
+
+    NumPy Fast Path:
+    For NumPy arrays of at least `FAST_PATH_MIN_SIZE` elements, the complement `target - arr[i]` of every element is
+    looked up with a single vectorized `np.searchsorted` call, so the whole scan runs in C instead of the
+    interpreter. The complement is rounded for floats, so the elements either side of each insertion point are
+    re-checked with the sum `arr[i] + arr[j] == target` itself. The first index with a partner, paired with its
+    highest partner, is the same pair the two-pointer sweep would return.
+    Integer and floating point arrays are instead swept by a branchless Numba kernel, compiled separately for each
+    dtype, when Numba is installed.
     """
-    left, right = 0, len(arr) - 1
+    if np is not None and isinstance(arr, np.ndarray) and arr.size >= FAST_PATH_MIN_SIZE:
+        kernel = _TWO_SUM_SORTED_KERNELS.get(arr.dtype.kind) if HAVE_NUMBA else None
+        if kernel is None:
+            return _two_sum_sorted_numpy(arr, target)
+        left, right = kernel(arr, target)
+        return None if left < 0 else (arr[left], arr[right])
+
+    n = len(arr)
+    if n < UNROLL_MAX_SIZE:
+        return _UNROLLED_TWO_SUM_SORTED[n](arr, target)
+
+    first = arr[0]
+    right = bisect_right(arr, target - first) - 1
+    while right + 1 < n and first + arr[right + 1] <= target:
+        right += 1
+    if right <= 0:
+        return None  # No pair found
+
+    last = arr[right]
+    left = bisect_left(arr, target - last, 0, right)
+    while left > 0 and arr[left - 1] + last >= target:
+        left -= 1
 
     while left < right:
         current_sum = arr[left] + arr[right]
@@ -41,6 +113,175 @@ def two_sum_sorted(arr, target):
     return None  # No pair found
 
 
+def _two_sum_sorted_numpy(arr, target):
+    """Vectorized `two_sum_sorted` for a 1-D NumPy array using `np.searchsorted`."""
+    partners = _two_sum_partners(arr, target)
+    found = partners >= 0
+
+    if not found.any():
+        return None  # No pair found
+
+    i = int(np.argmax(found))
+    return arr[i], arr[partners[i]]
+
+
+def _two_sum_partners(arr, targets):
+    """
+    Find a partner for every element of a sorted 1-D NumPy array, for each of `targets`.
+
+    Returns an index array of shape `np.shape(targets) + arr.shape` holding, for each target `t` and element `i`,
+    the highest index `j != i` with `arr[i] + arr[j] == t` among the two elements either side of the insertion
+    point of `t - arr[i]`, or -1 if neither matches.
+    """
+    if arr.dtype.kind in 'iu' and np.can_cast(arr.dtype, np.int64):
+        arr = arr.astype(np.int64, copy=False)  # Narrow integers would overflow in `targets - arr` and the sums
+    targets = np.asarray(targets)[..., None]
+    n = arr.size
+    positions = np.arange(n)
+    idx = np.searchsorted(arr, targets - arr, side='right')
+
+    partners = np.full(idx.shape, -1)
+    for candidate in (np.maximum(idx - 1, 0), np.minimum(idx, n - 1)):  # The later match wins
+        match = (arr[candidate] + arr == targets) & (candidate != positions)
+        partners = np.where(match, candidate, partners)
+
+    return partners
+
+
+def _make_unrolled_two_sum_sorted(n):
+    """
+    Generate a `two_sum_sorted` specialized for sequences of exactly `n` elements.
+
+    The generated function unpacks the sequence into locals and runs the two-pointer sweep fully unrolled: every
+    `(left, right)` state the sweep can reach becomes its own block of straight-line code, so there is no loop
+    counter, indexing or bounds check, and any call makes at most `n - 1` comparisons against `target`.
+    For example, `n = 3` produces:
+
+        def two_sum_sorted_3(arr, target):
+            [a0, a1, a2] = arr
+            current_sum = a0 + a2
+            if current_sum == target:
+                return a0, a2
+            if current_sum < target:
+                current_sum = a1 + a2
+                if current_sum == target:
+                    return a1, a2
+                if current_sum < target:
+                    return None
+                return None
+            current_sum = a0 + a1
+            ...
+    """
+    name = f'two_sum_sorted_{n}'
+    lines = [f'def {name}(arr, target):']
+    if n:
+        lines.append(f"    [{', '.join(f'a{i}' for i in range(n))}] = arr")
+
+    def emit(left, right, indent):
+        if left >= right:
+            lines.append(f'{indent}return None')
+            return
+        lines.append(f'{indent}current_sum = a{left} + a{right}')
+        lines.append(f'{indent}if current_sum == target:')
+        lines.append(f'{indent}    return a{left}, a{right}')
+        lines.append(f'{indent}if current_sum < target:')
+        emit(left + 1, right, indent + '    ')
+        emit(left, right - 1, indent)  # The `if` block above always returns, so this is its `else`
+
+    emit(0, n - 1, '    ')
+
+    namespace = {}
+    exec(compile('\n'.join(lines), f'<{name}>', 'exec'), namespace)
+    return namespace[name]
+
+
+# Generated once at import time and indexed by `len(arr)`.
+_UNROLLED_TWO_SUM_SORTED = tuple(_make_unrolled_two_sum_sorted(n) for n in range(UNROLL_MAX_SIZE))
+
+
+def _two_sum_sorted_sweep(arr, target):
+    """
+    Branchless two-pointer sweep for `two_sum_sorted` over a fixed-width numeric array.
+
+    The pointer updates are computed from the comparison result as an integer instead of through an if/else, so
+    the data-dependent branch that mispredicts on random input is replaced by straight-line `setcc` + `add`.
+    Returns the indices of the pair, or `(-1, -1)` if there is none.
+    """
+    left, right = 0, len(arr) - 1
+
+    while left < right:
+        current_sum = arr[left] + arr[right]
+        if current_sum == target:
+            return left, right
+
+        below = int(current_sum < target)
+        left += below
+        right -= 1 - below
+
+    return -1, -1
+
+
+# Numba compiles a separate specialization of each kernel per argument dtype on first use. Floats additionally get
+# `fastmath`, which lets LLVM assume no NaNs/infs in the comparisons. Both kernels wrap the same function and so
+# share its on-disk cache; that is safe because they are only ever called with disjoint (integer vs float) dtypes.
+_two_sum_sorted_kernel = njit(cache=True, boundscheck=False)(_two_sum_sorted_sweep)
+_two_sum_sorted_kernel_float = njit(cache=True, fastmath=True, boundscheck=False)(_two_sum_sorted_sweep)
+
+# Compiled `two_sum_sorted` kernels keyed by NumPy dtype kind.
+_TWO_SUM_SORTED_KERNELS = {
+    'i': _two_sum_sorted_kernel,
+    'u': _two_sum_sorted_kernel,
+    'f': _two_sum_sorted_kernel_float,
+}
+
+
+def two_sum_sorted_batched(arr, targets):
+    """
+    Answer `two_sum_sorted` for a batch of targets with a single vectorized NumPy search.
+
+    Problem Statement:
+    Given a sorted array `arr` and a sequence of target sums `targets`, return a list holding, for each target, the
+    pair that `two_sum_sorted(arr, target)` would return (or None).
+
+    Algorithm Description:
+    - Cast `arr` and `targets` to a common dtype once, up front.
+    - Build the `k x n` matrix of complements `targets[:, None] - arr[None, :]`.
+    - Look up every complement in `arr` with one `np.searchsorted` call.
+    - Complements are rounded for floats, so re-check the elements either side of each insertion point with the
+      sum `arr[i] + arr[j] == target` itself, keeping matches at an index other than the element's own
+      (see `_two_sum_partners`).
+    - The first element with a partner in each row, paired with that partner, gives the answer for that target.
+
+    `arr` is scanned once for all `k` targets while it is resident in cache, and all of the work runs in NumPy's
+    compiled loops. Without NumPy this falls back to calling `two_sum_sorted` once per target.
+
+    Time Complexity: O(k * n log n), vectorized.
+    Space Complexity: O(k * n) for the complement matrix.
+    """
+    if np is None:
+        return [two_sum_sorted(arr, target) for target in targets]
+
+    arr, targets = np.asarray(arr), np.asarray(targets)
+    dtype = np.result_type(arr, targets)
+    arr, targets = arr.astype(dtype, copy=False), targets.astype(dtype, copy=False)
+
+    n = arr.size
+    if n == 0:
+        return [None] * targets.size
+
+    partners = _two_sum_partners(arr, targets)
+    found = partners >= 0
+
+    first = np.argmax(found, axis=1)
+    rows = np.arange(targets.size)
+    hits = found[rows, first]
+
+    return [
+        (arr[i], arr[partners[row, i]]) if hit else None
+        for row, i, hit in zip(rows, first, hits)
+    ]
+
+
 def remove_duplicates(arr):
     """
     Remove duplicates from a sorted array in-place.
@@ -60,20 +301,44 @@ def remove_duplicates(arr):
     Space Complexity: O(1)
 
     This approach is more efficient than the brute force approach, which would require additional space to store the unique elements.
+
+    NumPy Fast Path:
+    For NumPy arrays, the "differs from previous" test is evaluated for every element at once with `np.not_equal`
+    into a preallocated mask, and the unique elements are compacted to the front with boolean indexing.
     """
+    if np is not None and isinstance(arr, np.ndarray):
+        return _remove_duplicates_numpy(arr)
+
     if not arr:
         return 0
 
     write_index = 1
+    prev = arr[0]
 
     for i in range(1, len(arr)):
-        if arr[i] != arr[i - 1]:
-            arr[write_index] = arr[i]
+        current = arr[i]
+        if current != prev:
+            arr[write_index] = current
             write_index += 1
+        prev = current
 
     return write_index
 
 
+def _remove_duplicates_numpy(arr):
+    """Vectorized `remove_duplicates` for a sorted 1-D NumPy array."""
+    if arr.size == 0:
+        return 0
+
+    mask = np.empty(arr.size, dtype=bool)
+    mask[0] = True
+    np.not_equal(arr[1:], arr[:-1], out=mask[1:])
+
+    n = int(mask.sum())
+    arr[:n] = arr[mask]  # Boolean indexing copies, so the overlapping write-back is safe
+    return n
+
+
 def reverse_string(s):
     """
     Reverse a string using the two-pointer technique.
@@ -84,27 +349,64 @@ def reverse_string(s):
     Category: Opposite Direction Pointers
 
     Algorithm Description:
-    - Convert the string to a list to allow modification.
-    - Initialize two pointers, one at the beginning (`left`) and one at the end (`right`) of the list.
+    - Conceptually, initialize two pointers, one at the beginning (`left`) and one at the end (`right`) of the string.
     - Swap the elements at these two pointers.
     - Move the `left` pointer to the right and the `right` pointer to the left.
     - Repeat until the pointers meet or cross each other.
-    - Convert the list back to a string and return it.
+
+    Python strings are immutable, so rather than copying into a list and swapping element by element, the
+    reversal is expressed as the slice `s[::-1]`. CPython performs it as a single C copy into a preallocated
+    result of the same kind and length. The same slice reverses `bytes` input.
+
+    A mutable `bytearray` is reversed in place with `bytearray.reverse`, which runs exactly this two-pointer swap
+    loop over the raw byte buffer in C. The same (now reversed) object is returned.
 
     Time Complexity: O(n)
-    Space Complexity: O(n) due to the conversion of the string to a list and back.
+    Space Complexity: O(n) for the reversed copy.
 
     This approach is more efficient than the brute force approach, which would involve creating a new string by iterating from the end.
     """
-    s = list(s)
-    left, right = 0, len(s) - 1
+    if isinstance(s, bytearray):
+        s.reverse()
+        return s
+
+    return s[::-1]
+
+
+def reverse_string_two_pointer(s):
+    """
+    Reverse a string with an explicit two-pointer swap loop.
+
+    Problem Statement:
+    Given a string `s`, reverse it, swapping characters with two pointers as in `reverse_string`'s algorithm
+    description rather than relying on slicing.
+
+    Category: Opposite Direction Pointers
+
+    Algorithm Description:
+    - Copy the string into a mutable, compact buffer: a `bytearray` for ASCII strings (1 byte per character),
+      otherwise an `array.array` of code points (4 bytes per character).
+    - Initialize two pointers, one at the beginning (`left`) and one at the end (`right`) of the buffer.
+    - Swap the elements at these two pointers.
+    - Move the `left` pointer to the right and the `right` pointer to the left.
+    - Repeat until the pointers meet or cross each other.
+    - Decode the buffer back into a string and return it.
+
+    Unlike `list(s)`, which stores a pointer to a separate string object per character, these buffers are contiguous
+    C arrays, so the swap loop touches far less memory.
+
+    Time Complexity: O(n)
+    Space Complexity: O(n) for the buffer.
+    """
+    buf = bytearray(s, 'ascii') if s.isascii() else array(_UNICODE_TYPECODE, s)
+    left, right = 0, len(buf) - 1
 
     while left < right:
-        s[left], s[right] = s[right], s[left]
+        buf[left], buf[right] = buf[right], buf[left]
         left += 1
         right -= 1
 
-    return ''.join(s)
+    return buf.decode('ascii') if isinstance(buf, bytearray) else buf.tounicode()
 
 
 def max_area(height):
@@ -127,16 +429,37 @@ def max_area(height):
     Space Complexity: O(1)
 
     This approach is more efficient than the brute force approach, which has a time complexity of O(n^2).
+
+    Numba Fast Path:
+    When Numba is installed, integer inputs of at least `FAST_PATH_MIN_SIZE` elements are converted once to an
+    `int64` array and handed to a compiled kernel running the same two-pointer loop natively. Floating point NumPy
+    arrays use a `float64` specialization of the same kernel. Anything else (float or mixed lists, integers beyond
+    the `int64` range) stays on the interpreted loop, so no height is ever truncated.
+
+    NumPy Fast Path:
+    Without Numba, large NumPy arrays are solved with whole-array operations instead (see `_max_area_numpy`).
     """
+    if HAVE_NUMBA and len(height) >= FAST_PATH_MIN_SIZE:
+        values = np.asarray(height)
+        if values.dtype.kind in 'iu' and np.can_cast(values.dtype, np.int64):
+            return int(_max_area_kernel(values.astype(np.int64, copy=False)))
+        if values.dtype.kind == 'f' and isinstance(height, np.ndarray):
+            return _max_area_kernel(values.astype(np.float64, copy=False))
+
+    if np is not None and isinstance(height, np.ndarray) and height.size >= FAST_PATH_MIN_SIZE:
+        return _max_area_numpy(height)
+
     left, right = 0, len(height) - 1
     max_area = 0
 
+    # Conditional expressions instead of min()/max() avoid two builtin calls per iteration
     while left < right:
+        h_left, h_right = height[left], height[right]
         width = right - left
-        current_area = min(height[left], height[right]) * width
-        max_area = max(max_area, current_area)
+        current_area = (h_left if h_left < h_right else h_right) * width
+        max_area = current_area if current_area > max_area else max_area
 
-        if height[left] < height[right]:
+        if h_left < h_right:
             left += 1
         else:
             right -= 1
@@ -144,6 +467,65 @@ def max_area(height):
     return max_area
 
 
+def _max_area_numpy(height):
+    """
+    Vectorized `max_area` for a 1-D NumPy array using prefix and suffix maxima.
+
+    In the best container the shorter line `i` should be paired with the line at least as tall as it that lies
+    farthest away on either side. The running maximum from the left is non-decreasing, so `np.searchsorted` finds
+    the leftmost line with `height >= height[i]` for every `i` at once; the running maximum from the right does the
+    same for the rightmost such line. The answer is the largest `height[i] * width` over all `i`.
+
+    Integer heights that fit in 16 bits (as in the usual constraint `height[i] <= 10^4`) are scanned as `int16`,
+    which halves the memory traffic of the running maxima and lets the SIMD loops inside NumPy process more lanes
+    at once; `widths` is `int64`, so the areas are still computed in 64 bits. Other heights are promoted with
+    `np.result_type(height, np.int64)`, so float heights keep their fractional part. The area is returned as a
+    Python `int` or `float` to match.
+    """
+    int16 = np.iinfo(np.int16)
+    if height.dtype.kind in 'iu' and height.size and int16.min <= height.min() and height.max() <= int16.max:
+        height = height.astype(np.int16, copy=False)
+    else:
+        height = height.astype(np.result_type(height, np.int64), copy=False)
+    n = height.size
+    positions = np.arange(n)
+
+    left_max = np.maximum.accumulate(height)
+    right_max_reversed = np.maximum.accumulate(height[::-1])
+
+    leftmost = np.searchsorted(left_max, height, side='left')
+    rightmost = n - 1 - np.searchsorted(right_max_reversed, height, side='left')
+
+    widths = np.maximum(rightmost - positions, positions - leftmost)
+    return (height * widths).max().item()
+
+
+@njit(cache=True, boundscheck=False)
+def _max_area_kernel(height):
+    """
+    Compiled two-pointer loop for `max_area` over an `int64` array.
+
+    The loop indexes `height` explicitly rather than iterating over it, and uses conditional expressions instead
+    of `min`/`max` so the comparisons lower to conditional moves.
+    """
+    left, right = 0, len(height) - 1
+    best = 0
+
+    while left < right:
+        h_left = height[left]
+        h_right = height[right]
+        lower = h_left if h_left < h_right else h_right
+        area = lower * (right - left)
+        best = area if area > best else best
+
+        if h_left < h_right:
+            left += 1
+        else:
+            right -= 1
+
+    return best
+
+
 def length_of_longest_substring(s):
     """
     Find the length of the longest substring without repeating characters.
@@ -154,31 +536,69 @@ def length_of_longest_substring(s):
     Category: Same Direction Pointers
 
     Algorithm Description:
-    - Use a set to keep track of characters in the current window.
+    - Keep a table recording, for each character, one past the index where it was last seen.
     - Initialize two pointers, `left` and `right`, both starting at the beginning of the string.
-    - Move the `right` pointer to expand the window and add characters to the set.
-    - If a character is already in the set, move the `left` pointer to shrink the window until the character is removed from the set.
-    - Keep track of the maximum length of the window during this process.
+    - Move the `right` pointer to expand the window one character at a time.
+    - If the character was last seen inside the current window, jump the `left` pointer directly past that
+      occurrence instead of shrinking the window one step at a time.
+    - Record the new position of the character and keep track of the maximum length of the window.
+
+    For ASCII strings the table is a flat 128-entry list indexed by character code, so the "is this character in
+    the window" check is a single index instead of a hash lookup. Other strings fall back to a `defaultdict`.
+    When Numba is installed, ASCII strings of at least `FAST_PATH_MIN_SIZE` characters are scanned by a compiled
+    kernel over their raw bytes.
 
     Time Complexity: O(n)
     Space Complexity: O(min(n, m)), where n is the length of the string and m is the size of the character set.
 
     This approach is more efficient than the brute force approach, which has a time complexity of O(n^3).
     """
-    char_set = set()
+    if s.isascii():
+        s = s.encode('ascii')  # Iterating bytes yields character codes directly
+        if HAVE_NUMBA and len(s) >= FAST_PATH_MIN_SIZE:
+            return int(_longest_substring_kernel(np.frombuffer(s, dtype=np.uint8)))
+        last = [0] * 128
+    else:
+        last = defaultdict(int)
+
     left = 0
     max_length = 0
 
-    for right in range(len(s)):
-        while s[right] in char_set:
-            char_set.remove(s[left])
-            left += 1
-        char_set.add(s[right])
-        max_length = max(max_length, right - left + 1)
+    for right, c in enumerate(s):
+        seen = last[c]
+        if seen > left:
+            left = seen
+        last[c] = right + 1
+        length = right - left + 1
+        max_length = length if length > max_length else max_length
 
     return max_length
 
 
+@njit(cache=True, boundscheck=False)
+def _longest_substring_kernel(codes):
+    """
+    Compiled single-pass `length_of_longest_substring` over a `uint8` array of ASCII codes.
+
+    Reading the last-seen position, moving `left` and recording the best length are fused into one loop body of
+    a few integer operations with a single, mostly predictable branch.
+    """
+    last = np.zeros(128, dtype=np.int64)
+    left = 0
+    best = 0
+
+    for right in range(len(codes)):
+        c = codes[right]
+        seen = last[c]
+        if seen > left:
+            left = seen
+        last[c] = right + 1
+        length = right - left + 1
+        best = length if length > best else best
+
+    return best
+
+
 def merge_sorted_arrays(arr1, arr2):
     """
     Merge two sorted arrays.
@@ -189,35 +609,109 @@ def merge_sorted_arrays(arr1, arr2):
     Category: Two Pointers for Merging
 
     Algorithm Description:
+    - Preallocate the merged array, since its length `n + m` is known up front.
     - Initialize two pointers, `i` and `j`, both starting at the beginning of `arr1` and `arr2` respectively.
-    - Compare the elements at these pointers and append the smaller element to the merged array.
+    - Compare the elements at these pointers and write the smaller element to the next slot of the merged array.
     - Move the pointer of the array from which the element was taken.
     - Continue this process until one of the arrays is fully traversed.
-    - Append the remaining elements of the other array to the merged array.
+    - Copy the remaining elements of the other array into the tail of the merged array.
 
     Time Complexity: O(n + m), where n and m are the lengths of arr1 and arr2 respectively.
     Space Complexity: O(n + m)
 
     This approach is more efficient than the brute force approach, which would involve concatenating the arrays and then sorting them, resulting in a time complexity of O((n + m) log(n + m)).
-    """
-    merged = []
-    i, j = 0, 0
 
-    while i < len(arr1) and j < len(arr2):
+    Fast Paths:
+    Timsort detects already-sorted runs, so sorting the concatenation of two sorted inputs is a single O(n + m)
+    merge performed in C rather than a brute force sort. NumPy arrays are concatenated into a preallocated buffer
+    and sorted in place with `kind='stable'`; lists totalling at least `FAST_PATH_MIN_SIZE` elements go through
+    `list.sort`. Smaller lists use the two-pointer loop below. Every path takes `arr2`'s element first when two
+    elements compare equal: `arr2` is placed ahead of `arr1` before the stable sort.
+    """
+    if np is not None and isinstance(arr1, np.ndarray) and isinstance(arr2, np.ndarray):
+        out = np.empty(len(arr1) + len(arr2), dtype=np.result_type(arr1, arr2))
+        np.concatenate([arr2, arr1], out=out)
+        out.sort(kind='stable')
+        return out
+
+    if len(arr1) + len(arr2) >= FAST_PATH_MIN_SIZE:
+        merged = list(arr2)
+        merged.extend(arr1)
+        merged.sort()
+        return merged
+
+    n, m = len(arr1), len(arr2)
+    merged = [None] * (n + m)
+    i, j, k = 0, 0, 0
+
+    while i < n and j < m:
         if arr1[i] < arr2[j]:
-            merged.append(arr1[i])
+            merged[k] = arr1[i]
             i += 1
         else:
-            merged.append(arr2[j])
+            merged[k] = arr2[j]
             j += 1
+        k += 1
 
-    # Append remaining elements
-    merged.extend(arr1[i:])
-    merged.extend(arr2[j:])
+    # Copy remaining elements (at most one of the arrays has any left)
+    merged[k:] = arr1[i:] if i < n else arr2[j:]
 
     return merged
 
 
+def merge_sorted_arrays_in_place(arr1, n, arr2):
+    """
+    Merge a sorted array into another one that has spare capacity at its end.
+
+    Problem Statement:
+    Given a sorted array `arr1` whose first `n` elements are valid and whose length is `n + len(arr2)`, and a sorted
+    array `arr2`, merge `arr2` into `arr1` so that `arr1` becomes a single sorted array. Nothing is returned.
+
+    Category: Two Pointers for Merging
+
+    Algorithm Description:
+    - Initialize `i` at the last valid element of `arr1`, `j` at the last element of `arr2`, and a write pointer `k`
+      at the last slot of `arr1`.
+    - Write the larger of `arr1[i]` and `arr2[j]` to `arr1[k]`, then move that pointer and `k` one step left.
+      On a tie `arr1[i]` is written first, so it ends up after `arr2[j]`, as in `merge_sorted_arrays`.
+    - Stop once `arr2` is exhausted; whatever remains of `arr1` is already in place.
+
+    Filling from the back means the write pointer never overtakes an unread element of `arr1`, so no element has to
+    be shifted and no extra storage is needed.
+
+    Time Complexity: O(n + m), where m is the length of arr2.
+    Space Complexity: O(1)
+    """
+    i, j = n - 1, len(arr2) - 1
+    k = n + len(arr2) - 1
+
+    while j >= 0:
+        if i >= 0 and arr1[i] >= arr2[j]:
+            arr1[k] = arr1[i]
+            i -= 1
+        else:
+            arr1[k] = arr2[j]
+            j -= 1
+        k -= 1
+
+
+class ListNode:
+    """
+    A singly linked list node for the fast and slow pointer examples below.
+
+    The attributes are declared in `__slots__`, so each node stores `val` and `next` in fixed fields instead of a
+    per-instance `__dict__`. Reading `node.next` is then a direct field load through a slot descriptor rather
+    than a dictionary lookup, which is what the pointer-chasing loops spend most of their time on.
+    Any object with `val` and `next` attributes works with these functions; this class is just the fastest one.
+    """
+
+    __slots__ = ('val', 'next')
+
+    def __init__(self, val, next=None):
+        self.val = val
+        self.next = next
+
+
 def has_cycle(head):
     """
     Detect a cycle in a linked list.
@@ -227,27 +721,36 @@ def has_cycle(head):
 
     Category: Fast and Slow Pointers
 
-    Algorithm Description:
-    - Initialize two pointers, `slow` and `fast`, both starting at the head of the linked list.
-    - Move the `slow` pointer one step at a time and the `fast` pointer two steps at a time.
-    - If there is a cycle, the `fast` pointer will eventually meet the `slow` pointer.
-    - If the `fast` pointer reaches the end of the list, there is no cycle.
+    Algorithm Description (Brent's algorithm):
+    - Start the `slow` pointer at the head and the `fast` pointer one node ahead.
+    - Move only the `fast` pointer, one step at a time, comparing it with `slow` after every step.
+    - Whenever `fast` has taken a power-of-two number of steps since `slow` was last moved, teleport `slow` to
+      `fast` and double the step budget.
+    - If there is a cycle, `fast` will eventually land on `slow`; if it reaches the end of the list, there is no cycle.
+
+    Compared with Floyd's tortoise and hare, which follows three `.next` links per step, Brent's algorithm
+    follows a single link per step and needs fewer steps on average to detect a cycle.
 
     Time Complexity: O(n)
     Space Complexity: O(1)
 
     This approach is more efficient than the brute force approach, which would require additional space to store the visited nodes.
     """
-    slow, fast = head, head
+    if head is None:
+        return False
 
-    while fast and fast.next:
-        slow = slow.next
-        fast = fast.next.next
+    power = steps = 1
+    slow, fast = head, head.next
 
-        if slow == fast:
-            return True
+    while fast is not None and fast is not slow:
+        if power == steps:
+            slow = fast
+            power *= 2
+            steps = 0
+        fast = fast.next
+        steps += 1
 
-    return False
+    return fast is not None
 
 
 def find_middle(head):
@@ -288,10 +791,11 @@ def detect_cycle_start(head):
 
     Category: Fast and Slow Pointers
 
-    Algorithm Description:
-    - Use the fast and slow pointer technique to detect if there is a cycle.
-    - If a cycle is detected, initialize another pointer at the head of the list.
-    - Move both the new pointer and the slow pointer one step at a time.
+    Algorithm Description (Brent's algorithm):
+    - Use Brent's variant of the fast and slow pointer technique (see `has_cycle`) to detect if there is a cycle.
+      When the pointers meet, the number of steps `fast` took since `slow` last moved is the cycle length.
+    - If a cycle is detected, start two pointers at the head and advance one of them by the cycle length.
+    - Move both pointers one step at a time.
     - The point at which they meet is the start of the cycle.
 
     Time Complexity: O(n)
@@ -299,27 +803,112 @@ def detect_cycle_start(head):
 
     This approach is more efficient than the brute force approach, which would require additional space to store the visited nodes.
     """
-    slow, fast = head, head
-
-    # First, determine if there is a cycle
-    while fast and fast.next:
-        slow = slow.next
-        fast = fast.next.next
-
-        if slow == fast:
-            break
-    else:
+    if head is None:
+        return None
+
+    # First, determine if there is a cycle and measure its length
+    power = cycle_length = 1
+    slow, fast = head, head.next
+
+    while fast is not None and fast is not slow:
+        if power == cycle_length:
+            slow = fast
+            power *= 2
+            cycle_length = 0
+        fast = fast.next
+        cycle_length += 1
+
+    if fast is None:
         return None  # No cycle
 
     # Find the start of the cycle
-    start = head
-    while start != slow:
+    start, ahead = head, head
+    for _ in range(cycle_length):
+        ahead = ahead.next
+
+    while start is not ahead:
         start = start.next
-        slow = slow.next
+        ahead = ahead.next
 
     return start
 
 
+def linked_list_to_arrays(head):
+    """
+    Convert a linked list into a structure-of-arrays layout.
+
+    Node `i` (in traversal order from `head`) is stored as `val[i]` and `nxt[i]`, where `nxt[i]` is the index of
+    the next node or -1 at the end of the list. Cycles are preserved as back-references. When Numba is available
+    `nxt` is an `int32` NumPy array, ready for the compiled `*_indexed` traversals.
+
+    Returns `(val, nxt, head_index)`, with `head_index` equal to -1 for an empty list.
+
+    Traversing `nxt` touches one small contiguous array instead of chasing pointers to objects scattered across
+    the heap, so each step of the fast and slow pointers is a cache-friendly indexed load.
+    """
+    index = {}
+    nodes = []
+    node = head
+
+    while node is not None and id(node) not in index:
+        index[id(node)] = len(nodes)
+        nodes.append(node)
+        node = node.next
+
+    val = [node.val for node in nodes]
+    nxt = [-1 if node.next is None else index[id(node.next)] for node in nodes]
+    if HAVE_NUMBA:
+        nxt = np.asarray(nxt, dtype=np.int32)
+
+    return val, nxt, (0 if nodes else -1)
+
+
+@njit(cache=True, boundscheck=False)
+def has_cycle_indexed(nxt, head):
+    """`has_cycle` over the `nxt` index array produced by `linked_list_to_arrays`."""
+    slow, fast = head, head
+
+    while fast != -1 and nxt[fast] != -1:
+        slow = nxt[slow]
+        fast = nxt[nxt[fast]]
+
+        if slow == fast:
+            return True
+
+    return False
+
+
+@njit(cache=True, boundscheck=False)
+def find_middle_indexed(nxt, head):
+    """`find_middle` over the `nxt` index array; returns the index of the middle node."""
+    slow, fast = head, head
+
+    while fast != -1 and nxt[fast] != -1:
+        slow = nxt[slow]
+        fast = nxt[nxt[fast]]
+
+    return slow
+
+
+@njit(cache=True, boundscheck=False)
+def detect_cycle_start_indexed(nxt, head):
+    """`detect_cycle_start` over the `nxt` index array; returns the index of the cycle start, or -1."""
+    slow, fast = head, head
+
+    while fast != -1 and nxt[fast] != -1:
+        slow = nxt[slow]
+        fast = nxt[nxt[fast]]
+
+        if slow == fast:
+            start = head
+            while start != slow:
+                start = nxt[start]
+                slow = nxt[slow]
+            return start
+
+    return -1
+
+
 import unittest
 
 class TestTwoPointerTechniques(unittest.TestCase):
@@ -328,6 +917,66 @@ class TestTwoPointerTechniques(unittest.TestCase):
         self.assertEqual(two_sum_sorted([1, 2, 3, 4, 6], 6), (2, 4))
         self.assertEqual(two_sum_sorted([2, 3, 4, 5, 7, 8], 10), (2, 8))
         self.assertIsNone(two_sum_sorted([1, 2, 3], 7))
+        self.assertEqual(two_sum_sorted([1, 3, 3, 5], 6), (1, 5))
+        self.assertEqual(two_sum_sorted([2, 3, 3, 7], 6), (3, 3))
+
+        # `target - arr[0]` rounds below 0.9626169514156583, so the bisect bound alone would skip the pair
+        floats = [0.21, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9626169514156583]
+        self.assertEqual(two_sum_sorted(floats, 0.21 + 0.9626169514156583), (0.21, 0.9626169514156583))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_two_sum_sorted_numpy(self):
+        arr = np.arange(0, 200, 2)
+        self.assertEqual(two_sum_sorted(arr, 10), (0, 10))
+        self.assertEqual(two_sum_sorted(np.array([3] * 64), 6), (3, 3))
+        self.assertIsNone(two_sum_sorted(arr, 7))
+
+        # The Numba kernels take int and float arrays when Numba is installed, so exercise the fallback directly
+        self.assertEqual(_two_sum_sorted_numpy(arr, 10), (0, 10))
+        self.assertEqual(_two_sum_sorted_numpy(np.array([1, 3, 3, 5]), 6), (1, 5))
+        self.assertEqual(_two_sum_sorted_numpy(np.array([2, 3, 3, 7]), 6), (3, 3))
+        self.assertIsNone(_two_sum_sorted_numpy(np.array([1, 3, 4]), 6))
+        self.assertIsNone(_two_sum_sorted_numpy(arr, 7))
+
+        # Targets outside a narrow integer dtype must not overflow
+        for dtype in (np.uint8, np.int8):
+            small = np.arange(64, dtype=dtype)
+            self.assertIsNone(_two_sum_sorted_numpy(small, 300))
+            self.assertEqual(_two_sum_sorted_numpy(small, 100), (37, 63))
+            self.assertIsNone(two_sum_sorted(small, 300))
+            self.assertEqual(two_sum_sorted(small, 100), (37, 63))
+
+        # Complements of floats are rounded; every real pair must still be found, as by the sweep
+        floats = np.sort(np.random.RandomState(0).rand(100))
+        for i in range(0, floats.size, 7):
+            for j in range(i + 1, floats.size, 5):
+                target = floats[i] + floats[j]
+                self.assertEqual(_two_sum_sorted_numpy(floats, target), two_sum_sorted(floats.tolist(), target))
+
+    def test_unrolled_two_sum_sorted(self):
+        two_sum_3 = _make_unrolled_two_sum_sorted(3)
+        self.assertEqual(two_sum_3([1, 2, 4], 6), (2, 4))
+        self.assertIsNone(two_sum_3([1, 2, 4], 4))
+        self.assertEqual(two_sum_3([3, 3, 4], 6), (3, 3))
+        self.assertIsNone(_make_unrolled_two_sum_sorted(0)([], 0))
+        n = UNROLL_MAX_SIZE - 1
+        self.assertEqual(two_sum_sorted(list(range(n)), 2 * n - 3), (n - 2, n - 1))
+        self.assertIsNone(two_sum_sorted([5], 10))
+
+    def test_two_sum_sorted_kernel(self):
+        self.assertEqual(_two_sum_sorted_kernel((1, 2, 3, 4, 6), 6), (1, 3))
+        self.assertEqual(_two_sum_sorted_kernel((2, 3, 4, 5, 7, 8), 10), (0, 5))
+        self.assertEqual(_two_sum_sorted_kernel((1, 2, 3), 7), (-1, -1))
+        self.assertEqual(_two_sum_sorted_kernel_float((0.5, 1.5, 2.0, 3.5), 4.0), (0, 3))
+
+    def test_two_sum_sorted_batched(self):
+        self.assertEqual(two_sum_sorted_batched([1, 2, 3, 4, 6], [6, 10, 2]), [(2, 4), (4, 6), None])
+        self.assertEqual(two_sum_sorted_batched([2, 3, 3, 5], [6, 4]), [(3, 3), None])
+        self.assertEqual(two_sum_sorted_batched([], [1]), [None])
+
+        floats = sorted([0.21, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9626169514156583])
+        targets = [a + b for i, a in enumerate(floats) for b in floats[i + 1:]]
+        self.assertEqual(two_sum_sorted_batched(floats, targets), [two_sum_sorted(floats, t) for t in targets])
 
     def test_remove_duplicates(self):
         arr = [1, 1, 2, 2, 3, 4, 4]
@@ -335,25 +984,103 @@ class TestTwoPointerTechniques(unittest.TestCase):
         self.assertEqual(new_length, 4)
         self.assertEqual(arr[:new_length], [1, 2, 3, 4])
 
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_remove_duplicates_numpy(self):
+        arr = np.array([1, 1, 2, 2, 3, 4, 4])
+        new_length = remove_duplicates(arr)
+        self.assertEqual(new_length, 4)
+        self.assertEqual(arr[:new_length].tolist(), [1, 2, 3, 4])
+        self.assertEqual(remove_duplicates(np.array([], dtype=int)), 0)
+
     def test_reverse_string(self):
         self.assertEqual(reverse_string("hello"), "olleh")
         self.assertEqual(reverse_string("abcd"), "dcba")
         self.assertEqual(reverse_string(""), "")
+        self.assertEqual(reverse_string(b"abc"), b"cba")
+
+        buf = bytearray(b"hello")
+        self.assertIs(reverse_string(buf), buf)
+        self.assertEqual(buf, bytearray(b"olleh"))
+
+    def test_reverse_string_two_pointer(self):
+        self.assertEqual(reverse_string_two_pointer("hello"), "olleh")
+        self.assertEqual(reverse_string_two_pointer("añb€"), "€bña")
+        self.assertEqual(reverse_string_two_pointer(""), "")
 
     def test_max_area(self):
         self.assertEqual(max_area([1, 8, 6, 2, 5, 4, 8, 3, 7]), 49)
         self.assertEqual(max_area([1, 1]), 1)
         self.assertEqual(max_area([4, 3, 2, 1, 4]), 16)
 
+    def test_max_area_kernel(self):
+        self.assertEqual(_max_area_kernel((1, 8, 6, 2, 5, 4, 8, 3, 7)), 49)
+        self.assertEqual(max_area([1, 2] * FAST_PATH_MIN_SIZE), 2 * (2 * FAST_PATH_MIN_SIZE - 2))
+        self.assertEqual(max_area([1.5] * FAST_PATH_MIN_SIZE), 1.5 * (FAST_PATH_MIN_SIZE - 1))
+        self.assertEqual(max_area([2 ** 70] * FAST_PATH_MIN_SIZE), 2 ** 70 * (FAST_PATH_MIN_SIZE - 1))
+        self.assertEqual(_max_area_kernel((1.5, 0.5, 1.5)), 3.0)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_max_area_numpy(self):
+        self.assertEqual(_max_area_numpy(np.array([1, 8, 6, 2, 5, 4, 8, 3, 7])), 49)
+        self.assertEqual(_max_area_numpy(np.array([4, 3, 2, 1, 4])), 16)
+        self.assertEqual(_max_area_numpy(np.array([1, 1])), 1)
+        self.assertEqual(_max_area_numpy(np.array([10000, 1, 10000] * 1000, dtype=np.int32)), 10000 * 2999)
+        self.assertEqual(_max_area_numpy(np.array([70000, 1, 70000])), 140000)
+        self.assertEqual(_max_area_numpy(np.array([1.5] * 100)), 148.5)
+        self.assertEqual(_max_area_numpy(np.array([1.5, 0.5, 1.5] * 100)), 1.5 * 299)  # Fits int16 but is not integer
+        self.assertEqual(_max_area_numpy(np.array([-1, 30000, 30000] * 1000)), 30000 * 2998)
+        self.assertEqual(_max_area_numpy(np.array([0.5, 2.0, 0.5], dtype=np.float32)), 1.0)
+        self.assertEqual(max_area(np.array([1.5] * 100)), 148.5)
+
     def test_length_of_longest_substring(self):
         self.assertEqual(length_of_longest_substring("abcabcbb"), 3)
         self.assertEqual(length_of_longest_substring("bbbbb"), 1)
         self.assertEqual(length_of_longest_substring("pwwkew"), 3)
+        self.assertEqual(length_of_longest_substring("abba"), 2)
+        self.assertEqual(length_of_longest_substring("éaéb"), 3)
+        self.assertEqual(length_of_longest_substring("abcabcbb" * FAST_PATH_MIN_SIZE), 3)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_longest_substring_kernel(self):
+        self.assertEqual(_longest_substring_kernel(np.frombuffer(b"abcabcbb", dtype=np.uint8)), 3)
+        self.assertEqual(_longest_substring_kernel(np.frombuffer(b"pwwkew", dtype=np.uint8)), 3)
+        self.assertEqual(_longest_substring_kernel(np.frombuffer(b"", dtype=np.uint8)), 0)
 
     def test_merge_sorted_arrays(self):
         self.assertEqual(merge_sorted_arrays([1, 3, 5], [2, 4, 6]), [1, 2, 3, 4, 5, 6])
         self.assertEqual(merge_sorted_arrays([1, 2, 3], [4, 5, 6]), [1, 2, 3, 4, 5, 6])
         self.assertEqual(merge_sorted_arrays([], [1, 2, 3]), [1, 2, 3])
+        self.assertEqual(merge_sorted_arrays(list(range(0, 100, 2)), list(range(1, 100, 2))), list(range(100)))
+
+        # Ties take arr2's element first, whichever path the input size selects
+        for size in (2, FAST_PATH_MIN_SIZE):
+            merged = merge_sorted_arrays([1.0] * size, [1] * size)
+            self.assertEqual([type(x) for x in merged], [int] * size + [float] * size)
+
+    def test_merge_sorted_arrays_in_place(self):
+        arr1 = [1, 3, 5, 0, 0, 0]
+        merge_sorted_arrays_in_place(arr1, 3, [2, 4, 6])
+        self.assertEqual(arr1, [1, 2, 3, 4, 5, 6])
+
+        arr1 = [4, 5, 6, 0, 0]
+        merge_sorted_arrays_in_place(arr1, 3, [1, 2])
+        self.assertEqual(arr1, [1, 2, 4, 5, 6])
+
+        arr1 = [0, 0]
+        merge_sorted_arrays_in_place(arr1, 0, [1, 2])
+        self.assertEqual(arr1, [1, 2])
+
+        # Ties take arr2's element first, as in merge_sorted_arrays
+        for size in (2, FAST_PATH_MIN_SIZE):
+            arr1 = [1.0] * size + [None] * size
+            merge_sorted_arrays_in_place(arr1, size, [1] * size)
+            self.assertEqual([type(x) for x in arr1], [int] * size + [float] * size)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_merge_sorted_arrays_numpy(self):
+        merged = merge_sorted_arrays(np.array([1, 3, 5]), np.array([2.5, 4.5]))
+        self.assertEqual(merged.dtype, np.float64)
+        self.assertEqual(merged.tolist(), [1, 2.5, 3, 4.5, 5])
 
     def test_has_cycle(self):
         class ListNode:
@@ -427,5 +1154,69 @@ class TestTwoPointerTechniques(unittest.TestCase):
         head2.next = node2
         self.assertIsNone(detect_cycle_start(head2))
 
+    def test_cycle_detection_edge_cases(self):
+        def build(length, cycle_start=None):
+            nodes = [ListNode(x) for x in range(length)]
+            for node, following in zip(nodes, nodes[1:]):
+                node.next = following
+            if cycle_start is not None:
+                nodes[-1].next = nodes[cycle_start]
+            return nodes
+
+        self.assertFalse(has_cycle(None))
+        self.assertIsNone(detect_cycle_start(None))
+
+        single = build(1)  # Single node, no cycle
+        self.assertFalse(has_cycle(single[0]))
+        self.assertIsNone(detect_cycle_start(single[0]))
+
+        self_loop = build(1, cycle_start=0)
+        self.assertTrue(has_cycle(self_loop[0]))
+        self.assertIs(detect_cycle_start(self_loop[0]), self_loop[0])
+
+        back_to_head = build(5, cycle_start=0)
+        self.assertTrue(has_cycle(back_to_head[0]))
+        self.assertIs(detect_cycle_start(back_to_head[0]), back_to_head[0])
+
+        long_tail = build(13, cycle_start=10)  # Tail of 10 nodes into a cycle of 3
+        self.assertTrue(has_cycle(long_tail[0]))
+        self.assertIs(detect_cycle_start(long_tail[0]), long_tail[10])
+
+    def test_list_node(self):
+        nodes = [ListNode(x) for x in range(1, 6)]
+        for node, following in zip(nodes, nodes[1:]):
+            node.next = following
+
+        self.assertFalse(hasattr(nodes[0], '__dict__'))
+        self.assertFalse(has_cycle(nodes[0]))
+        self.assertEqual(find_middle(nodes[0]).val, 3)
+
+        nodes[-1].next = nodes[2]  # Creates a cycle
+        self.assertTrue(has_cycle(nodes[0]))
+        self.assertIs(detect_cycle_start(nodes[0]), nodes[2])
+
+    def test_linked_list_indexed(self):
+        class ListNode:
+            def __init__(self, x):
+                self.val = x
+                self.next = None
+
+        nodes = [ListNode(x) for x in [3, 2, 0, -4, 5]]
+        for node, following in zip(nodes, nodes[1:]):
+            node.next = following
+
+        val, nxt, head = linked_list_to_arrays(nodes[0])
+        self.assertEqual(val, [3, 2, 0, -4, 5])
+        self.assertFalse(has_cycle_indexed(nxt, head))
+        self.assertEqual(val[find_middle_indexed(nxt, head)], 0)
+        self.assertEqual(detect_cycle_start_indexed(nxt, head), -1)
+
+        nodes[-1].next = nodes[1]  # Creates a cycle
+        val, nxt, head = linked_list_to_arrays(nodes[0])
+        self.assertTrue(has_cycle_indexed(nxt, head))
+        self.assertEqual(val[detect_cycle_start_indexed(nxt, head)], 2)
+
+        self.assertEqual(linked_list_to_arrays(None)[2], -1)
+
 if __name__ == '__main__':
     unittest.main()